@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 
 import jwt
-from dotenv import load_dotenv
+from lightrag.utils import load_dotenv_once
 from fastapi import HTTPException, status
 from pydantic import BaseModel
 
@@ -10,7 +10,7 @@ from .config import global_args
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+load_dotenv_once()
 
 
 class TokenPayload(BaseModel):
@@ -27,6 +27,8 @@ class AuthHandler:
         self.expire_hours = global_args.token_expire_hours
         self.guest_expire_hours = global_args.guest_token_expire_hours
         self.accounts = {}
+        self._guest_token = None
+        self._guest_token_expire = None
         auth_accounts = global_args.auth_accounts
         if auth_accounts:
             for account in auth_accounts.split(","):
@@ -70,6 +72,30 @@ class AuthHandler:
 
         return jwt.encode(payload.dict(), self.secret, algorithm=self.algorithm)
 
+    def get_guest_token(self) -> str:
+        """
+        Get the guest token used when authentication is disabled
+
+        The token is cached and only signed again once half of its lifetime
+        has passed, so clients always receive a token that is still valid
+        for a while.
+
+        Returns:
+            str: Encoded JWT token
+        """
+        now = datetime.utcnow()
+        refresh_margin = timedelta(hours=self.guest_expire_hours / 2)
+        if (
+            self._guest_token is None
+            or now >= self._guest_token_expire - refresh_margin
+        ):
+            # Taken before signing, so it is never later than the token's exp
+            self._guest_token_expire = now + timedelta(hours=self.guest_expire_hours)
+            self._guest_token = self.create_token(
+                username="guest", role="guest", metadata={"auth_mode": "disabled"}
+            )
+        return self._guest_token
+
     def validate_token(self, token: str) -> dict:
         """
         Validate JWT token
@@ -5,18 +5,20 @@ Configs for the LightRAG API.
 import os
 import argparse
 import logging
-from dotenv import load_dotenv
-from lightrag.utils import get_env_value
+from lightrag import __version__ as core_version
+from lightrag.api import __api_version__
+from lightrag.utils import get_env_value, load_dotenv_once
 
 from lightrag.constants import (
     DEFAULT_WOKERS,
     DEFAULT_TIMEOUT,
 )
 
+
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+load_dotenv_once()
 
 
 class OllamaServerInfos:
@@ -51,20 +53,22 @@ def get_default_host(binding_type: str) -> str:
     )  # fallback to ollama if unknown
 
 
-def parse_args() -> argparse.Namespace:
+def build_parser() -> argparse.ArgumentParser:
     """
-    Parse command line arguments with environment variable fallback
-
-    Args:
-        is_uvicorn_mode: Whether running under uvicorn mode
+    Build the command line parser, defaults are read from environment variables
 
     Returns:
-        argparse.Namespace: Parsed arguments
+        argparse.ArgumentParser: Parser for the LightRAG server options
     """
 
     parser = argparse.ArgumentParser(
         description="LightRAG FastAPI Server with separate working and input directories"
     )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {core_version} (API {__api_version__})",
+    )
 
     # Server configuration
     parser.add_argument(
@@ -78,6 +82,12 @@ def parse_args() -> argparse.Namespace:
         default=get_env_value("PORT", 9621, int),
         help="Server port (default: from env or 9621)",
     )
+    parser.add_argument(
+        "--eager-bind",
+        action="store_true",
+        default=get_env_value("EAGER_BIND", False, bool),
+        help="Bind the listening socket before the app is created, uvicorn mode only (default: from env or False)",
+    )
 
     # Directory configuration
     parser.add_argument(
@@ -125,6 +135,17 @@ def parse_args() -> argparse.Namespace:
         default=get_env_value("VERBOSE", False, bool),
         help="Enable verbose debug output(only valid for DEBUG log-level)",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Restart the server with python -X importtime, the import timings are written to stderr",
+    )
+    parser.add_argument(
+        "--no-splash",
+        action="store_true",
+        default=get_env_value("NO_SPLASH", False, bool),
+        help="Do not print the startup splash screen (default: from env or False)",
+    )
 
     parser.add_argument(
         "--key",
@@ -227,7 +248,18 @@ def parse_args() -> argparse.Namespace:
         help="Use custom LLM and embedding functions from run_lightrag_gemini_jina.py, overriding --llm-binding and --embedding-binding."
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments with environment variable fallback
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+
+    args = build_parser().parse_args()
 
     # convert relative path to absolute path
     args.working_dir = os.path.abspath(args.working_dir)
@@ -304,13 +336,15 @@ def parse_args() -> argparse.Namespace:
 
 
 def update_uvicorn_mode_config():
+    """Adjust global_args for single-process uvicorn mode, only called from main()"""
     # If in uvicorn mode and workers > 1, force it to 1 and log warning
     if global_args.workers > 1:
         original_workers = global_args.workers
         global_args.workers = 1
         # Log warning directly here
         logging.warning(
-            f"In uvicorn mode, workers parameter was set to {original_workers}. Forcing workers=1"
+            f"In uvicorn mode, workers parameter was set to {original_workers}. Forcing workers=1, "
+            "use lightrag-gunicorn to run multiple workers"
         )
 
 
@@ -2,43 +2,62 @@
 LightRAG FastAPI Server
 """
 
+# Modules only needed once create_app() runs, imported lazily on Python 3.15+
+# (PEP 810) and ignored by older interpreters
+__lazy_modules__ = [
+    "httpx",
+    "fastapi.security",
+    "lightrag.api.routers.document_routes",
+    "lightrag.api.routers.query_routes",
+    "lightrag.api.routers.graph_routes",
+    "lightrag.api.routers.ollama_api",
+]
+
+# Parse the command line before the FastAPI stack is imported, so --help,
+# --version and argument errors exit without paying for it
+from .config import (
+    global_args,
+    get_default_host,
+)
 from fastapi import FastAPI, Depends, HTTPException, status
 import asyncio
+import functools
+import importlib
 import os
+import atexit
 import logging
 import logging.config
-import uvicorn
-import pipmaster as pm
+import logging.handlers
+import queue
+import socket
+import threading
+import weakref
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 from pathlib import Path
-import configparser
+from types import MappingProxyType
+from typing import Callable, Optional, Tuple
+import httpx
 from ascii_colors import ASCIIColors
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from dotenv import load_dotenv
 from lightrag.api.utils_api import (
     get_combined_auth_dependency,
     display_splash_screen,
     check_env_file,
+    install_missing_packages,
 )
-from .config import (
-    global_args,
-    update_uvicorn_mode_config,
-    get_default_host,
-)
-from lightrag.utils import get_env_value
+from lightrag.utils import get_env_value, load_dotenv_once
 import sys
 from lightrag import LightRAG, __version__ as core_version
 from lightrag.api import __api_version__
-from lightrag.types import GPTKeywordExtractionFormat
 from lightrag.utils import EmbeddingFunc
 
 # --- Python Path Modification and Custom Function Imports START ---
 import sys # sys was already imported, ensure it's fine
 import os # os was already imported
 # Assuming lightrag_server.py is in .../LightRAG/lightrag/api/
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+project_root = str(Path(__file__).resolve().parents[2])
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
@@ -80,19 +99,100 @@ from lightrag.api.auth import auth_handler
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+# skipped when config.py has already loaded it in this process
+load_dotenv_once()
 # Removed existing custom function definitions as they are now imported.
 
 webui_title = os.getenv("WEBUI_TITLE")
 webui_description = os.getenv("WEBUI_DESCRIPTION")
 
-# Initialize config parser
-config = configparser.ConfigParser()
-config.read("config.ini")
+# Version and WebUI fields shared by the /auth-status, /login and /health responses
+_BASE_META = MappingProxyType(
+    {
+        "core_version": core_version,
+        "api_version": __api_version__,
+        "webui_title": webui_title,
+        "webui_description": webui_description,
+    }
+)
+
+# WebUI static files directory, created once per process instead of per create_app call
+_STATIC_DIR = Path(__file__).parent / "webui"
+_STATIC_DIR.mkdir(exist_ok=True)
+
 
 # Global authentication configuration
 auth_configured = bool(auth_handler.accounts)
 
+_SUPPORTED_LLM_BINDINGS = frozenset(
+    {"lollms", "ollama", "openai", "openai-ollama", "azure_openai", "gemini"}
+)
+_SUPPORTED_EMBEDDING_BINDINGS = frozenset(
+    {"lollms", "ollama", "openai", "azure_openai", "gemini", "jina"}
+)
+
+# Binding name -> (module, complete function name, embedding function name)
+_BINDING_FUNCS = {
+    "lollms": ("lightrag.llm.lollms", "lollms_model_complete", "lollms_embed"),
+    "ollama": ("lightrag.llm.ollama", "ollama_model_complete", "ollama_embed"),
+    "openai": ("lightrag.llm.openai", "openai_complete_if_cache", "openai_embed"),
+    # config.py splits openai-ollama into openai LLM and ollama embedding bindings
+    "openai-ollama": ("lightrag.llm.openai", "openai_complete_if_cache", None),
+    "azure_openai": (
+        "lightrag.llm.azure_openai",
+        "azure_openai_complete_if_cache",
+        "azure_openai_embed",
+    ),
+    "gemini": ("lightrag.llm.gemini", "gemini_complete", "gemini_embed"),
+    "jina": ("lightrag.llm.jina", None, "jina_embed"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_llm_funcs(binding: str) -> Tuple[Optional[Callable], Optional[Callable]]:
+    """Import a binding module once and return its (complete_func, embed_func)"""
+    if binding not in _BINDING_FUNCS:
+        raise ValueError(f"Unsupported or misconfigured binding: {binding}")
+    module_name, complete_name, embed_name = _BINDING_FUNCS[binding]
+    module = importlib.import_module(module_name)
+    complete_func = getattr(module, complete_name) if complete_name else None
+    embed_func = getattr(module, embed_name) if embed_name else None
+    return complete_func, embed_func
+
+
+def _make_openai_alike_complete(complete_func, model, **client_kwargs):
+    """Build an OpenAI-style LLM wrapper with model and client settings bound once"""
+
+    async def model_complete(
+        prompt,
+        system_prompt=None,
+        history_messages=None,
+        keyword_extraction=False,
+        **kwargs,
+    ) -> str:
+        # keyword_extraction is not forwarded, llm_model_kwargs only adds timeout
+        return await complete_func(
+            model,
+            prompt,
+            system_prompt=system_prompt,
+            history_messages=history_messages or [],
+            **client_kwargs,
+            **kwargs,
+        )
+
+    return model_complete
+
+
+def _create_eager_task(coro) -> asyncio.Task:
+    """Create a task that starts running right away on Python 3.12+
+
+    Only this task is started eagerly, the loop's task factory is left
+    untouched so request handling tasks keep their normal scheduling.
+    """
+    if sys.version_info >= (3, 12):
+        return asyncio.eager_task_factory(asyncio.get_running_loop(), coro)
+    return asyncio.create_task(coro)
+
 
 def create_app(args):
     # Setup logging
@@ -100,15 +200,16 @@ def create_app(args):
     set_verbose_debug(args.verbose)
 
     # Verify that bindings are correctly setup
-    # Note: config.py already validates choices, but extra check here is fine
-    supported_llm_bindings = ["lollms", "ollama", "openai", "openai-ollama", "azure_openai", "gemini"]
-    supported_embedding_bindings = ["lollms", "ollama", "openai", "azure_openai", "gemini", "jina"]
-
-    if args.llm_binding not in supported_llm_bindings:
-        raise ValueError(f"Unsupported llm binding: {args.llm_binding}. Supported: {supported_llm_bindings}")
-
-    if args.embedding_binding not in supported_embedding_bindings:
-         raise ValueError(f"Unsupported embedding binding: {args.embedding_binding}. Supported: {supported_embedding_bindings}")
+    # Note: config.py already validates choices with argparse, so these are only
+    # sanity checks and are skipped under python -O
+    assert args.llm_binding in _SUPPORTED_LLM_BINDINGS, (
+        f"Unsupported llm binding: {args.llm_binding}. "
+        f"Supported: {sorted(_SUPPORTED_LLM_BINDINGS)}"
+    )
+    assert args.embedding_binding in _SUPPORTED_EMBEDDING_BINDINGS, (
+        f"Unsupported embedding binding: {args.embedding_binding}. "
+        f"Supported: {sorted(_SUPPORTED_EMBEDDING_BINDINGS)}"
+    )
 
     # Set default hosts if not provided (config.py handles this now, but keep for clarity)
     if args.llm_binding_host is None:
@@ -131,20 +232,46 @@ def create_app(args):
     # Check if API key is provided either through env var or args
     api_key = os.getenv("LIGHTRAG_API_KEY") or args.key
 
+    # Allowed CORS origins from global_args, defaults to {"*"} if not set.
+    # CORSMiddleware keeps the collection as given and tests `origin in ...`,
+    # so a frozenset makes the per-request origin check O(1)
+    if global_args.cors_origins == "*":
+        allowed_origins = frozenset({"*"})
+    else:
+        allowed_origins = frozenset(
+            origin.strip() for origin in global_args.cors_origins.split(",")
+        )
+
     # Initialize document manager
     doc_manager = DocumentManager(args.input_dir)
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         """Lifespan context manager for startup and shutdown events"""
-        # Store background tasks
-        app.state.background_tasks = set()
+        # Track background tasks, finished tasks drop out of the WeakSet on their own
+        app.state.background_tasks = weakref.WeakSet()
 
         try:
-            # Initialize database connections
-            await rag.initialize_storages()
+            if use_shared_openai_client:
+                # Only the OpenAI bindings need the openai package, import it here
+                from openai import DefaultAsyncHttpxClient
+
+                # Created per lifespan run, so a restarted app never sees a closed
+                # client. Every concurrent LLM and embedding call can keep its
+                # connection alive, never fewer than the openai SDK default of 100
+                keepalive = max(100, args.max_async + rag.embedding_func_max_async)
+                openai_client_configs["http_client"] = DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=max(1000, keepalive),
+                        max_keepalive_connections=keepalive,
+                    )
+                )
 
-            await initialize_pipeline_status()
+            # Initialize database connections and pipeline status concurrently,
+            # storage initialization does not touch the pipeline_status namespace
+            await asyncio.gather(
+                rag.initialize_storages(), initialize_pipeline_status()
+            )
             pipeline_status = await get_namespace_data("pipeline_status")
 
             should_start_autoscan = False
@@ -157,10 +284,12 @@ def create_app(args):
 
             # Only run auto scan when no other process started it first
             if should_start_autoscan:
-                # Create background task
-                task = asyncio.create_task(run_scanning_process(rag, doc_manager))
+                # Create background task. The event loop only keeps weak references
+                # to tasks, the strong one is the `task` local, which lives in this
+                # generator frame until shutdown. The eager start only runs up to the
+                # threaded directory walk, so startup does not wait for the scan
+                task = _create_eager_task(run_scanning_process(rag, doc_manager))
                 app.state.background_tasks.add(task)
-                task.add_done_callback(app.state.background_tasks.discard)
                 logger.info(f"Process {os.getpid()} auto scan task started at startup.")
 
             ASCIIColors.green("\nServer is ready to accept connections! 🚀\n")
@@ -170,6 +299,9 @@ def create_app(args):
         finally:
             # Clean up database connections
             await rag.finalize_storages()
+            http_client = openai_client_configs.pop("http_client", None)
+            if http_client is not None:
+                await http_client.aclose()
 
     # Initialize FastAPI
     app_kwargs = {
@@ -194,22 +326,14 @@ def create_app(args):
 
     app = FastAPI(**app_kwargs)
 
-    def get_cors_origins():
-        """Get allowed origins from global_args
-        Returns a list of allowed origins, defaults to ["*"] if not set
-        """
-        origins_str = global_args.cors_origins
-        if origins_str == "*":
-            return ["*"]
-        return [origin.strip() for origin in origins_str.split(",")]
-
-    # Add CORS middleware
+    # Add CORS middleware, let browsers cache preflight responses for 10 minutes
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=get_cors_origins(),
+        allow_origins=allowed_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        max_age=600,
     )
 
     # Create combined auth dependency for all endpoints
@@ -218,75 +342,18 @@ def create_app(args):
     # Create working directory if it doesn't exist
     Path(args.working_dir).mkdir(parents=True, exist_ok=True)
 
-    # --- Import necessary functions based on bindings ---
-    if args.llm_binding == "lollms" or args.embedding_binding == "lollms":
-        from lightrag.llm.lollms import lollms_model_complete, lollms_embed
-    if args.llm_binding == "ollama" or args.embedding_binding == "ollama":
-        from lightrag.llm.ollama import ollama_model_complete, ollama_embed
-    if args.llm_binding == "openai" or args.embedding_binding == "openai":
-        from lightrag.llm.openai import openai_complete_if_cache, openai_embed
-    if args.llm_binding == "azure_openai" or args.embedding_binding == "azure_openai":
-        from lightrag.llm.azure_openai import (
-            azure_openai_complete_if_cache,
-            azure_openai_embed,
-        )
-    # Handle openai-ollama combination explicitly if needed (config.py might already resolve this)
-    if args.llm_binding == "openai" and args.embedding_binding == "ollama":
-        # Imports likely already handled above, but good to be explicit if needed
-        pass
-    if args.llm_binding == "gemini" or args.embedding_binding == "gemini":
-        from lightrag.llm.gemini import gemini_complete, gemini_embed
-        from lightrag.llm.jina import jina_embed # Assuming this function exists/will be created
-
-    # --- Define Helper Wrappers (indented correctly) ---
-    async def openai_alike_model_complete(
-        prompt,
-        system_prompt=None,
-        history_messages=None,
-        keyword_extraction=False,
-        **kwargs,
-    ) -> str:
-        keyword_extraction = kwargs.pop("keyword_extraction", None)
-        if keyword_extraction:
-            kwargs["response_format"] = GPTKeywordExtractionFormat
-        if history_messages is None:
-            history_messages = []
-        # Temperature is now passed via llm_model_kwargs
-        # kwargs["temperature"] = args.temperature
-        return await openai_complete_if_cache(
-            args.llm_model,
-            prompt,
-            system_prompt=system_prompt,
-            history_messages=history_messages,
-            base_url=args.llm_binding_host,
-            api_key=args.llm_binding_api_key,
-            **kwargs, # Pass remaining kwargs including temperature
-        )
+    # One connection pool shared by all OpenAI LLM and embedding calls, so
+    # requests reuse keep-alive connections instead of reconnecting per call.
+    # lifespan puts the client into this dict, the wrappers read it per call
+    openai_client_configs = {}
+    use_shared_openai_client = (
+        args.llm_binding in ("openai", "openai-ollama")
+        or args.embedding_binding == "openai"
+    )
 
-    async def azure_openai_model_complete(
-        prompt,
-        system_prompt=None,
-        history_messages=None,
-        keyword_extraction=False,
-        **kwargs,
-    ) -> str:
-        keyword_extraction = kwargs.pop("keyword_extraction", None)
-        if keyword_extraction:
-            kwargs["response_format"] = GPTKeywordExtractionFormat
-        if history_messages is None:
-            history_messages = []
-        # Temperature is now passed via llm_model_kwargs
-        # kwargs["temperature"] = args.temperature
-        return await azure_openai_complete_if_cache(
-            args.llm_model,
-            prompt,
-            system_prompt=system_prompt,
-            history_messages=history_messages,
-            base_url=args.llm_binding_host,
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"), # Key still read from env here
-            api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview"),
-            **kwargs, # Pass remaining kwargs including temperature
-        )
+    # Azure settings are fixed after startup, read them once instead of per LLM call
+    azure_api_key = os.getenv("AZURE_OPENAI_API_KEY")
+    azure_api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
 
     # --- Determine LLM and Embedding functions based on bindings or custom flag ---
     final_llm_func_to_use = None
@@ -300,19 +367,27 @@ def create_app(args):
         if args.use_custom_bindings and not (custom_functions_available and gemini_llm_complete_func):
             print("WARNING: --use-custom-bindings specified, but custom Gemini LLM function is not available. Falling back to CLI --llm-binding.")
         
-        if args.llm_binding == "lollms":
-            final_llm_func_to_use = lollms_model_complete
-        elif args.llm_binding == "ollama":
-            final_llm_func_to_use = ollama_model_complete
-        elif args.llm_binding == "openai":
-            final_llm_func_to_use = openai_alike_model_complete
+        # Binding modules are imported only when their functions are used, once per process
+        llm_binding_func, _ = _get_llm_funcs(args.llm_binding)
+        # Model and client settings are bound once in the OpenAI-style wrappers
+        if args.llm_binding in ("openai", "openai-ollama"):
+            final_llm_func_to_use = _make_openai_alike_complete(
+                llm_binding_func,
+                args.llm_model,
+                base_url=args.llm_binding_host,
+                api_key=args.llm_binding_api_key,
+                openai_client_configs=openai_client_configs,
+            )
         elif args.llm_binding == "azure_openai":
-            final_llm_func_to_use = azure_openai_model_complete
-        elif args.llm_binding == "gemini": # Standard gemini binding from lightrag.llm.gemini
-            final_llm_func_to_use = gemini_complete
-        else:
-            # This case should ideally be caught by argparse choices, but as a safeguard:
-            raise ValueError(f"Unsupported or misconfigured llm_binding: {args.llm_binding}")
+            final_llm_func_to_use = _make_openai_alike_complete(
+                llm_binding_func,
+                args.llm_model,
+                base_url=args.llm_binding_host,
+                api_key=azure_api_key,
+                api_version=azure_api_version,
+            )
+        else:  # lollms, ollama and standard gemini complete functions are used as is
+            final_llm_func_to_use = llm_binding_func
 
     # Embedding Function Selection
     if args.use_custom_bindings and custom_functions_available and jina_embedding_func:
@@ -342,45 +417,50 @@ def create_app(args):
         if args.use_custom_bindings and not (custom_functions_available and jina_embedding_func):
             print("WARNING: --use-custom-bindings specified, but custom Jina embedding function is not available. Falling back to CLI --embedding-binding.")
 
-        selected_embed_lambda = None
+        _, embedding_binding_func = _get_llm_funcs(args.embedding_binding)
+        selected_embed_func = None
         if args.embedding_binding == "lollms":
-            selected_embed_lambda = lambda texts: lollms_embed(
-                texts,
+            selected_embed_func = functools.partial(
+                embedding_binding_func,
                 embed_model=args.embedding_model,
                 host=args.embedding_binding_host,
                 api_key=args.embedding_binding_api_key,
             )
         elif args.embedding_binding == "ollama":
-            selected_embed_lambda = lambda texts: ollama_embed(
-                texts,
+            selected_embed_func = functools.partial(
+                embedding_binding_func,
                 embed_model=args.embedding_model,
                 host=args.embedding_binding_host,
                 api_key=args.embedding_binding_api_key,
             )
         elif args.embedding_binding == "azure_openai":
-            selected_embed_lambda = lambda texts: azure_openai_embed(
-                texts,
+            selected_embed_func = functools.partial(
+                embedding_binding_func,
                 model=args.embedding_model,
                 api_key=args.embedding_binding_api_key, # This should be AZURE_OPENAI_API_KEY from env
             )
         elif args.embedding_binding == "openai":
-            selected_embed_lambda = lambda texts: openai_embed(
-                texts,
-                model=args.embedding_model,
-                base_url=args.embedding_binding_host,
-                api_key=args.embedding_binding_api_key,
-            )
+            # Not a partial: LightRAG deep-copies its config via dataclasses.asdict,
+            # and the shared http client must not be copied (functions are not)
+            async def selected_embed_func(texts):
+                return await embedding_binding_func(
+                    texts,
+                    model=args.embedding_model,
+                    base_url=args.embedding_binding_host,
+                    api_key=args.embedding_binding_api_key,
+                    client_configs=openai_client_configs,
+                )
         elif args.embedding_binding == "gemini": # Standard gemini binding from lightrag.llm.gemini
-             selected_embed_lambda = lambda texts: gemini_embed(
-                texts,
+             selected_embed_func = functools.partial(
+                embedding_binding_func,
                 model_name=args.embedding_model, # e.g., "models/embedding-001"
                 # api_key=os.getenv("GEMINI_API_KEY") # gemini_embed handles API key via genai.configure
             )
         elif args.embedding_binding == "jina":
             # Assuming lightrag.llm.jina.jina_embed exists and handles API key via os.getenv("JINA_API_KEY")
             # It would use args.embedding_model for the model name.
-            selected_embed_lambda = lambda texts: jina_embed(
-                texts,
+            selected_embed_func = functools.partial(
+                embedding_binding_func,
                 embed_model=args.embedding_model, # e.g., "jina-clip-v2"
                 # host and api_key are typically handled internally by jina_embed using env vars
             )
@@ -388,11 +468,11 @@ def create_app(args):
             # This case should ideally be caught by argparse choices, but as a safeguard:
             raise ValueError(f"Unsupported or misconfigured embedding_binding: {args.embedding_binding}")
         
-        if selected_embed_lambda:
+        if selected_embed_func:
             final_embedding_func_to_use = EmbeddingFunc(
                 embedding_dim=args.embedding_dim,
                 max_token_size=args.max_embed_tokens,
-                func=selected_embed_lambda
+                func=selected_embed_func
             )
         else: # Should not happen if choices are validated by argparse
             raise ValueError(f"Could not determine embedding function for binding: {args.embedding_binding}")
@@ -402,19 +482,18 @@ def create_app(args):
     llm_kwargs_for_rag = {}
     if not (args.use_custom_bindings and custom_functions_available and gemini_llm_complete_func):
         # Only populate these if not using custom LLM func, as custom func handles its own specifics
-        llm_kwargs_for_rag = {
-            "host": args.llm_binding_host, # For lollms, ollama, openai
-            "timeout": args.timeout,
-            "options": {"num_ctx": args.max_tokens}, # ollama/lollms specific
-            "api_key": args.llm_binding_api_key, # for lollms, ollama, openai
-        }
-        if args.llm_binding == "azure_openai":
-            llm_kwargs_for_rag["api_version"] = os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
-            # AZURE_OPENAI_API_KEY is read inside azure_openai_model_complete wrapper
-            # Remove host/api_key if they are not used by azure_openai_model_complete directly
-            llm_kwargs_for_rag.pop("host", None)
-            llm_kwargs_for_rag.pop("api_key", None)
-        elif args.llm_binding == "gemini": # Standard gemini
+        if args.llm_binding in ("openai", "openai-ollama", "azure_openai"):
+            # Client settings are bound in the OpenAI-style wrapper, everything
+            # else here is forwarded to chat.completions.create
+            llm_kwargs_for_rag = {"timeout": args.timeout}
+        else:
+            llm_kwargs_for_rag = {
+                "host": args.llm_binding_host, # For lollms, ollama
+                "timeout": args.timeout,
+                "options": {"num_ctx": args.max_tokens}, # ollama/lollms specific
+                "api_key": args.llm_binding_api_key, # for lollms, ollama
+            }
+        if args.llm_binding == "gemini": # Standard gemini
              # Gemini functions usually configured globally or handle API key internally
             llm_kwargs_for_rag.pop("host", None)
             llm_kwargs_for_rag.pop("api_key", None)
@@ -425,23 +504,18 @@ def create_app(args):
              # Custom function handles its own model, host, api_key internally
         }
 
-
-        logger.info(f"ROO_DEBUG: Final embedding function to use: {final_embedding_func_to_use}")
-        if final_embedding_func_to_use:
-            logger.info(f"ROO_DEBUG: Final embedding_func_to_use.embedding_dim: {final_embedding_func_to_use.embedding_dim}")
-            logger.info(f"ROO_DEBUG: Final embedding_func_to_use.max_token_size: {final_embedding_func_to_use.max_token_size}")
-            logger.info(f"ROO_DEBUG: Final embedding_func_to_use func: {final_embedding_func_to_use.func}")
-        logger.info(f"ROO_DEBUG: args.embedding_dim: {args.embedding_dim}")
-        logger.info(f"ROO_DEBUG: args.embedding_model: {args.embedding_model}")
-        logger.info(f"ROO_DEBUG: args.embedding_binding: {args.embedding_binding}")
-        logger.info(f"ROO_DEBUG: args.use_custom_bindings: {args.use_custom_bindings}")
-        logger.info(f"ROO_DEBUG: custom_functions_available: {custom_functions_available}")
-        if custom_functions_available and jina_embedding_func:
-            try:
-                from run_lightrag_gemini_jina import JINA_EMBEDDING_DIM
-                logger.info(f"ROO_DEBUG: JINA_EMBEDDING_DIM from run_lightrag_gemini_jina: {JINA_EMBEDDING_DIM}")
-            except ImportError:
-                logger.info("ROO_DEBUG: JINA_EMBEDDING_DIM not found in run_lightrag_gemini_jina.py")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Final embedding func: %s dim=%s max_token_size=%s "
+            "(binding=%s, model=%s, use_custom_bindings=%s, custom_functions_available=%s)",
+            final_embedding_func_to_use,
+            getattr(final_embedding_func_to_use, "embedding_dim", None),
+            getattr(final_embedding_func_to_use, "max_token_size", None),
+            args.embedding_binding,
+            args.embedding_model,
+            args.use_custom_bindings,
+            custom_functions_available,
+        )
 
     rag = LightRAG(
         working_dir=args.working_dir,
@@ -488,46 +562,33 @@ def create_app(args):
 
         if not auth_handler.accounts:
             # Authentication not configured, return guest token
-            guest_token = auth_handler.create_token(
-                username="guest", role="guest", metadata={"auth_mode": "disabled"}
-            )
+            guest_token = auth_handler.get_guest_token()
             return {
                 "auth_configured": False,
                 "access_token": guest_token,
                 "token_type": "bearer",
                 "auth_mode": "disabled",
                 "message": "Authentication is disabled. Using guest access.",
-                "core_version": core_version,
-                "api_version": __api_version__,
-                "webui_title": webui_title,
-                "webui_description": webui_description,
+                **_BASE_META,
             }
 
         return {
             "auth_configured": True,
             "auth_mode": "enabled",
-            "core_version": core_version,
-            "api_version": __api_version__,
-            "webui_title": webui_title,
-            "webui_description": webui_description,
+            **_BASE_META,
         }
 
     @app.post("/login")
     async def login(form_data: OAuth2PasswordRequestForm = Depends()):
         if not auth_handler.accounts:
             # Authentication not configured, return guest token
-            guest_token = auth_handler.create_token(
-                username="guest", role="guest", metadata={"auth_mode": "disabled"}
-            )
+            guest_token = auth_handler.get_guest_token()
             return {
                 "access_token": guest_token,
                 "token_type": "bearer",
                 "auth_mode": "disabled",
                 "message": "Authentication is disabled. Using guest access.",
-                "core_version": core_version,
-                "api_version": __api_version__,
-                "webui_title": webui_title,
-                "webui_description": webui_description,
+                **_BASE_META,
             }
         username = form_data.username
         if auth_handler.accounts.get(username) != form_data.password:
@@ -543,50 +604,45 @@ def create_app(args):
             "access_token": user_token,
             "token_type": "bearer",
             "auth_mode": "enabled",
-            "core_version": core_version,
-            "api_version": __api_version__,
-            "webui_title": webui_title,
-            "webui_description": webui_description,
+            **_BASE_META,
         }
 
+    # Server configuration never changes after startup, build it once for /health
+    health_config = {
+        # LLM configuration binding/host address (if applicable)/model (if applicable)
+        "llm_binding": args.llm_binding,
+        "llm_binding_host": args.llm_binding_host,
+        "llm_model": args.llm_model,
+        # embedding model configuration binding/host address (if applicable)/model (if applicable)
+        "embedding_binding": args.embedding_binding,
+        "embedding_binding_host": args.embedding_binding_host,
+        "embedding_model": args.embedding_model,
+        "max_tokens": args.max_tokens,
+        "kv_storage": args.kv_storage,
+        "doc_status_storage": args.doc_status_storage,
+        "graph_storage": args.graph_storage,
+        "vector_storage": args.vector_storage,
+        "enable_llm_cache_for_extract": args.enable_llm_cache_for_extract,
+        "enable_llm_cache": args.enable_llm_cache,
+    }
+    health_auth_mode = "enabled" if auth_configured else "disabled"
+    working_directory = str(args.working_dir)
+    input_directory = str(args.input_dir)
+
     @app.get("/health", dependencies=[Depends(combined_auth)])
     async def get_status():
         """Get current system status"""
         try:
             pipeline_status = await get_namespace_data("pipeline_status")
 
-            if not auth_configured:
-                auth_mode = "disabled"
-            else:
-                auth_mode = "enabled"
-
             return {
                 "status": "healthy",
-                "working_directory": str(args.working_dir),
-                "input_directory": str(args.input_dir),
-                "configuration": {
-                    # LLM configuration binding/host address (if applicable)/model (if applicable)
-                    "llm_binding": args.llm_binding,
-                    "llm_binding_host": args.llm_binding_host,
-                    "llm_model": args.llm_model,
-                    # embedding model configuration binding/host address (if applicable)/model (if applicable)
-                    "embedding_binding": args.embedding_binding,
-                    "embedding_binding_host": args.embedding_binding_host,
-                    "embedding_model": args.embedding_model,
-                    "max_tokens": args.max_tokens,
-                    "kv_storage": args.kv_storage,
-                    "doc_status_storage": args.doc_status_storage,
-                    "graph_storage": args.graph_storage,
-                    "vector_storage": args.vector_storage,
-                    "enable_llm_cache_for_extract": args.enable_llm_cache_for_extract,
-                    "enable_llm_cache": args.enable_llm_cache,
-                },
-                "auth_mode": auth_mode,
+                "working_directory": working_directory,
+                "input_directory": input_directory,
+                "configuration": health_config,
+                "auth_mode": health_auth_mode,
                 "pipeline_busy": pipeline_status.get("busy", False),
-                "core_version": core_version,
-                "api_version": __api_version__,
-                "webui_title": webui_title,
-                "webui_description": webui_description,
+                **_BASE_META,
             }
         except Exception as e:
             logger.error(f"Error getting health status: {str(e)}")
@@ -594,22 +650,23 @@ def create_app(args):
 
     # Custom StaticFiles class to prevent caching of HTML files
     class NoCacheStaticFiles(StaticFiles):
+        _NO_CACHE_HEADERS = {
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0",
+        }
+
         async def get_response(self, path: str, scope):
             response = await super().get_response(path, scope)
             if path.endswith(".html"):
-                response.headers["Cache-Control"] = (
-                    "no-cache, no-store, must-revalidate"
-                )
-                response.headers["Pragma"] = "no-cache"
-                response.headers["Expires"] = "0"
+                response.headers.update(self._NO_CACHE_HEADERS)
             return response
 
     # Webui mount webui/index.html
-    static_dir = Path(__file__).parent / "webui"
-    static_dir.mkdir(exist_ok=True)
     app.mount(
         "/webui",
-        NoCacheStaticFiles(directory=static_dir, html=True, check_dir=True),
+        # _STATIC_DIR is created at import time, no need to check it again
+        NoCacheStaticFiles(directory=_STATIC_DIR, html=True, check_dir=False),
         name="webui",
     )
 
@@ -623,8 +680,64 @@ def get_application(args=None):
     return create_app(args)
 
 
+# Log file max size and backup count, read from the environment once at import
+_LOG_MAX_BYTES = get_env_value("LOG_MAX_BYTES", DEFAULT_LOG_MAX_BYTES, int)
+_LOG_BACKUP_COUNT = get_env_value("LOG_BACKUP_COUNT", DEFAULT_LOG_BACKUP_COUNT, int)
+
+# File logging goes through a queue, a listener thread does the actual disk writes
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener():
+    """Flush queued records and close the file handler of the log listener"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+def _queued_file_handler(filename, maxBytes, backupCount, encoding):
+    """dictConfig factory returning a QueueHandler backed by a rotating log file"""
+    global _log_listener
+    _stop_log_listener()
+    file_handler = logging.handlers.RotatingFileHandler(
+        filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding
+    )
+    _log_listener = logging.handlers.QueueListener(_log_queue, file_handler)
+    _log_listener.start()
+    return logging.handlers.QueueHandler(_log_queue)
+
+
+atexit.register(_stop_log_listener)
+
+
+def _get_log_file_path() -> str:
+    """Absolute path of the server log file, LOG_DIR defaults to the current directory"""
+    log_dir = os.getenv("LOG_DIR", os.getcwd())
+    return os.path.abspath(os.path.join(log_dir, DEFAULT_LOG_FILENAME))
+
+
+# Set once configure_logging() has run, cleared again by reset_logging()
+_LOGGING_CONFIGURED = False
+# Log file path chosen by the last configure_logging() call
+_log_file_path: Optional[str] = None
+
+
+def reset_logging():
+    """Stop the file log listener and allow configure_logging() to run again"""
+    global _LOGGING_CONFIGURED
+    _stop_log_listener()
+    _LOGGING_CONFIGURED = False
+
+
 def configure_logging():
-    """Configure logging for uvicorn startup"""
+    """Configure logging for uvicorn startup, only the first call has any effect"""
+    global _LOGGING_CONFIGURED, _log_file_path
+    if _LOGGING_CONFIGURED:
+        return
 
     # Reset any existing handlers to ensure clean configuration
     for logger_name in ["uvicorn", "uvicorn.access", "uvicorn.error", "lightrag"]:
@@ -632,16 +745,10 @@ def configure_logging():
         logger.handlers = []
         logger.filters = []
 
-    # Get log directory path from environment variable
-    log_dir = os.getenv("LOG_DIR", os.getcwd())
-    log_file_path = os.path.abspath(os.path.join(log_dir, DEFAULT_LOG_FILENAME))
-
-    print(f"\nLightRAG log file: {log_file_path}\n")
-    os.makedirs(os.path.dirname(log_dir), exist_ok=True)
-
-    # Get log file max size and backup count from environment variables
-    log_max_bytes = get_env_value("LOG_MAX_BYTES", DEFAULT_LOG_MAX_BYTES, int)
-    log_backup_count = get_env_value("LOG_BACKUP_COUNT", DEFAULT_LOG_BACKUP_COUNT, int)
+    # Log file path from the LOG_DIR environment variable, read only once
+    log_file_path = _get_log_file_path()
+    _log_file_path = log_file_path
+    os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
 
     logging.config.dictConfig(
         {
@@ -663,10 +770,10 @@ def configure_logging():
                 },
                 "file": {
                     "formatter": "detailed",
-                    "class": "logging.handlers.RotatingFileHandler",
+                    "()": _queued_file_handler,
                     "filename": log_file_path,
-                    "maxBytes": log_max_bytes,
-                    "backupCount": log_backup_count,
+                    "maxBytes": _LOG_MAX_BYTES,
+                    "backupCount": _LOG_BACKUP_COUNT,
                     "encoding": "utf-8",
                 },
             },
@@ -702,27 +809,94 @@ def configure_logging():
             },
         }
     )
+    # Only marked done once dictConfig succeeded, a failed attempt can be retried
+    _LOGGING_CONFIGURED = True
 
 
 def check_and_install_dependencies():
-    """Check and install required dependencies"""
+    """Check and install required dependencies
+
+    The check is skipped when LIGHTRAG_SKIP_DEP_CHECK is set.
+    """
+    if get_env_value("LIGHTRAG_SKIP_DEP_CHECK", False, bool):
+        return
+
     required_packages = [
         "uvicorn",
-        "tiktoken",
         "fastapi",
         # Add other required packages here
     ]
 
-    for package in required_packages:
-        if not pm.is_installed(package):
-            print(f"Installing {package}...")
-            pm.install(package)
-            print(f"{package} installed successfully")
+    install_missing_packages(required_packages)
+
+
+@functools.lru_cache(maxsize=1)
+def _uvicorn_cfg(
+    host: str,
+    port: int,
+    ssl: bool,
+    ssl_certfile: Optional[str],
+    ssl_keyfile: Optional[str],
+) -> MappingProxyType:
+    """Read-only uvicorn settings for the given server options, the app is added by the caller"""
+    cfg = {
+        "host": host,
+        "port": port,
+        "log_config": None,  # Disable default config
+        # uvloop and httptools are used when installed, else asyncio and h11
+        "loop": "auto",
+        "http": "auto",
+    }
+    if ssl:
+        cfg["ssl_certfile"] = ssl_certfile
+        cfg["ssl_keyfile"] = ssl_keyfile
+    return MappingProxyType(cfg)
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    """Create a listening TCP socket for uvicorn (--eager-bind)"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    # Same backlog as uvicorn's default
+    sock.listen(2048)
+    return sock
+
+
+def _prewarm_imports() -> threading.Thread:
+    """Import uvicorn in a background thread
+
+    The later import in main() then only hits sys.modules. Binding modules are
+    left out on purpose, importing them may run pip installs.
+    """
+    module_names = ["uvicorn"]
+
+    def import_all():
+        for module_name in module_names:
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                # The real import on the main thread reports the error
+                pass
+
+    thread = threading.Thread(target=import_all, name="lightrag-prewarm", daemon=True)
+    thread.start()
+    return thread
 
 
 def main():
+    # Re-exec with import time profiling, the marker variable makes it happen only once
+    if global_args.profile_startup and not os.environ.get("LIGHTRAG_PROFILED"):
+        os.environ["LIGHTRAG_PROFILED"] = "1"
+        code = "from lightrag.api.lightrag_server import main; main()"
+        os.execv(
+            sys.executable,
+            [sys.executable, "-X", "importtime", "-c", code, *sys.argv[1:]],
+        )
+
     # Check if running under Gunicorn
-    if "GUNICORN_CMD_ARGS" in os.environ:
+    if os.environ.get("GUNICORN_CMD_ARGS") is not None:
         # If started with Gunicorn, return directly as Gunicorn will call get_application
         print("Running under Gunicorn - worker management handled by Gunicorn")
         return
@@ -734,38 +908,64 @@ def main():
     # Check and install dependencies
     check_and_install_dependencies()
 
-    from multiprocessing import freeze_support
+    # Take the listening socket now, connections arriving while the app is
+    # created wait in the backlog instead of being refused
+    eager_sock = (
+        _bind_socket(global_args.host, global_args.port)
+        if global_args.eager_bind
+        else None
+    )
+
+    # Load uvicorn while logging and the splash screen are set up
+    prewarm_thread = _prewarm_imports()
+
+    # freeze_support() is a no-op outside frozen Windows executables
+    if sys.platform == "win32" or getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
 
-    freeze_support()
+        freeze_support()
 
     # Configure logging before parsing args
     configure_logging()
+
+    # Single-process mode only, Gunicorn workers (get_application) never need it
+    from .config import update_uvicorn_mode_config
+
     update_uvicorn_mode_config()
     display_splash_screen(global_args)
 
+    # Only needed to serve, keep it off the import path of get_application/Gunicorn
+    prewarm_thread.join()
+    import uvicorn
+
     # Create application instance directly instead of using factory function
     app = create_app(global_args)
 
-    # Start Uvicorn in single process mode
+    # Start Uvicorn in single process mode. Uvicorn's own workers (import string
+    # with factory=True) are not used: each spawned worker would get private
+    # pipeline status and storage locks, only lightrag-gunicorn shares them
     uvicorn_config = {
         "app": app,  # Pass application instance directly instead of string path
-        "host": global_args.host,
-        "port": global_args.port,
-        "log_config": None,  # Disable default config
+        **_uvicorn_cfg(
+            global_args.host,
+            global_args.port,
+            global_args.ssl,
+            global_args.ssl_certfile,
+            global_args.ssl_keyfile,
+        ),
     }
 
-    if global_args.ssl:
-        uvicorn_config.update(
-            {
-                "ssl_certfile": global_args.ssl_certfile,
-                "ssl_keyfile": global_args.ssl_keyfile,
-            }
-        )
-
-    print(
-        f"Starting Uvicorn server in single-process mode on {global_args.host}:{global_args.port}"
-    )
-    uvicorn.run(**uvicorn_config)
+    # Startup status lines go out in a single write right before serving
+    status_lines = [
+        f"\nLightRAG log file: {_log_file_path}\n",
+        f"Starting Uvicorn server in single-process mode on {global_args.host}:{global_args.port}",
+    ]
+    sys.stdout.write("\n".join(status_lines) + "\n")
+    sys.stdout.flush()
+    if eager_sock is not None:
+        uvicorn.Server(uvicorn.Config(**uvicorn_config)).run(sockets=[eager_sock])
+    else:
+        uvicorn.run(**uvicorn_config)
 
 
 if __name__ == "__main__":
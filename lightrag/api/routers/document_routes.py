@@ -696,7 +696,8 @@ async def save_temp_file(input_dir: Path, file: UploadFile = File(...)) -> Path:
 async def run_scanning_process(rag: LightRAG, doc_manager: DocumentManager):
     """Background task to scan and index documents"""
     try:
-        new_files = doc_manager.scan_directory_for_new_files()
+        # The directory walk blocks, keep it off the event loop
+        new_files = await asyncio.to_thread(doc_manager.scan_directory_for_new_files)
         total_files = len(new_files)
         logger.info(f"Found {total_files} new files to index.")
 
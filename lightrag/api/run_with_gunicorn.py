@@ -6,8 +6,11 @@ Start LightRAG server with Gunicorn
 import os
 import sys
 import signal
-import pipmaster as pm
-from lightrag.api.utils_api import display_splash_screen, check_env_file
+from lightrag.api.utils_api import (
+    display_splash_screen,
+    check_env_file,
+    install_missing_packages,
+)
 from lightrag.api.config import global_args
 from lightrag.utils import get_env_value
 from lightrag.kg.shared_storage import initialize_share_data, finalize_share_data
@@ -22,16 +25,11 @@ def check_and_install_dependencies():
     """Check and install required dependencies"""
     required_packages = [
         "gunicorn",
-        "tiktoken",
         "psutil",
         # Add other required packages here
     ]
 
-    for package in required_packages:
-        if not pm.is_installed(package):
-            print(f"Installing {package}...")
-            pm.install(package)
-            print(f"{package} installed successfully")
+    install_missing_packages(required_packages)
 
 
 # Signal handler for graceful shutdown
@@ -2,7 +2,9 @@
 Utility functions for the LightRAG API.
 """
 
+import io
 import os
+import re
 import argparse
 from typing import Optional, List, Tuple
 import sys
@@ -38,6 +40,69 @@ def check_env_file():
     return True
 
 
+def find_missing_packages(packages: List[str]) -> List[str]:
+    """
+    Return the packages that are not installed
+
+    Installed distributions are collected in one pass over the sys.path
+    directories, using the names of their .dist-info/.egg-info entries, so
+    no package metadata has to be parsed. A name not found that way is
+    confirmed with importlib.metadata before it is reported as missing.
+
+    Args:
+        packages: Distribution names to look for
+
+    Returns:
+        List[str]: Names from packages without an installed distribution
+    """
+    from importlib import metadata
+
+    def normalize(name: str) -> str:
+        return re.sub(r"[-_.]+", "-", name).lower()
+
+    installed = set()
+    for path in sys.path:
+        try:
+            entries = os.listdir(path or ".")
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.endswith((".dist-info", ".egg-info")):
+                installed.add(normalize(entry.rsplit(".", 1)[0].split("-", 1)[0]))
+
+    missing = []
+    for package in packages:
+        if normalize(package) in installed:
+            continue
+        try:
+            metadata.distribution(package)
+        except metadata.PackageNotFoundError:
+            missing.append(package)
+    return missing
+
+
+def install_missing_packages(packages: List[str]) -> None:
+    """
+    Install the packages that are not installed yet, exits the process on failure
+
+    Args:
+        packages: Distribution names to check
+    """
+    missing_packages = find_missing_packages(packages)
+    if not missing_packages:
+        return
+
+    import pipmaster as pm
+
+    # One pip run for all missing packages instead of one per package
+    names = ", ".join(missing_packages)
+    print(f"Installing {names}...")
+    if not pm.install_multiple(missing_packages):
+        print(f"Failed to install {names}")
+        sys.exit(1)
+    print(f"{names} installed successfully")
+
+
 # Get whitelist paths from global_args, only once during initialization
 whitelist_paths = global_args.whitelist_paths.split(",")
 
@@ -124,7 +189,7 @@ def get_combined_auth_dependency(api_key: Optional[str] = None):
                     # check if the 'token' itself is the configured API key.
                     if api_key_configured and token == api_key:
                         return  # Allow access if the token matches the API key
-                    raise # Otherwise, re-raise the original 401 from JWT validation
+                    raise  # Otherwise, re-raise the original 401 from JWT validation
                 # For other exceptions, continue processing
 
         # 3. Acept all request if no API protection needed
@@ -175,167 +240,194 @@ def display_splash_screen(args: argparse.Namespace) -> None:
     """
     Display a colorful splash screen showing LightRAG server configuration
 
+    The splash is rendered into a buffer and written to stdout in one go,
+    nothing is printed when --no-splash is set.
+
     Args:
         args: Parsed command line arguments
     """
+    if args.no_splash:
+        return
+
+    out = io.StringIO()
+
     # Banner
-    ASCIIColors.cyan(f"""
+    ASCIIColors.cyan(
+        f"""
     ╔══════════════════════════════════════════════════════════════╗
     ║                  🚀 LightRAG Server v{core_version}/{api_version}              ║
     ║          Fast, Lightweight RAG Server Implementation         ║
     ╚══════════════════════════════════════════════════════════════╝
-    """)
+    """,
+        file=out,
+    )
 
     # Server Configuration
-    ASCIIColors.magenta("\n📡 Server Configuration:")
-    ASCIIColors.white("    ├─ Host: ", end="")
-    ASCIIColors.yellow(f"{args.host}")
-    ASCIIColors.white("    ├─ Port: ", end="")
-    ASCIIColors.yellow(f"{args.port}")
-    ASCIIColors.white("    ├─ Workers: ", end="")
-    ASCIIColors.yellow(f"{args.workers}")
-    ASCIIColors.white("    ├─ CORS Origins: ", end="")
-    ASCIIColors.yellow(f"{args.cors_origins}")
-    ASCIIColors.white("    ├─ SSL Enabled: ", end="")
-    ASCIIColors.yellow(f"{args.ssl}")
+    ASCIIColors.magenta("\n📡 Server Configuration:", file=out)
+    ASCIIColors.white("    ├─ Host: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.host}", file=out)
+    ASCIIColors.white("    ├─ Port: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.port}", file=out)
+    ASCIIColors.white("    ├─ Workers: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.workers}", file=out)
+    ASCIIColors.white("    ├─ CORS Origins: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.cors_origins}", file=out)
+    ASCIIColors.white("    ├─ SSL Enabled: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.ssl}", file=out)
     if args.ssl:
-        ASCIIColors.white("    ├─ SSL Cert: ", end="")
-        ASCIIColors.yellow(f"{args.ssl_certfile}")
-        ASCIIColors.white("    ├─ SSL Key: ", end="")
-        ASCIIColors.yellow(f"{args.ssl_keyfile}")
-    ASCIIColors.white("    ├─ Ollama Emulating Model: ", end="")
-    ASCIIColors.yellow(f"{ollama_server_infos.LIGHTRAG_MODEL}")
-    ASCIIColors.white("    ├─ Log Level: ", end="")
-    ASCIIColors.yellow(f"{args.log_level}")
-    ASCIIColors.white("    ├─ Verbose Debug: ", end="")
-    ASCIIColors.yellow(f"{args.verbose}")
-    ASCIIColors.white("    ├─ History Turns: ", end="")
-    ASCIIColors.yellow(f"{args.history_turns}")
-    ASCIIColors.white("    ├─ API Key: ", end="")
-    ASCIIColors.yellow("Set" if args.key else "Not Set")
-    ASCIIColors.white("    └─ JWT Auth: ", end="")
-    ASCIIColors.yellow("Enabled" if args.auth_accounts else "Disabled")
+        ASCIIColors.white("    ├─ SSL Cert: ", end="", file=out)
+        ASCIIColors.yellow(f"{args.ssl_certfile}", file=out)
+        ASCIIColors.white("    ├─ SSL Key: ", end="", file=out)
+        ASCIIColors.yellow(f"{args.ssl_keyfile}", file=out)
+    ASCIIColors.white("    ├─ Ollama Emulating Model: ", end="", file=out)
+    ASCIIColors.yellow(f"{ollama_server_infos.LIGHTRAG_MODEL}", file=out)
+    ASCIIColors.white("    ├─ Log Level: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.log_level}", file=out)
+    ASCIIColors.white("    ├─ Verbose Debug: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.verbose}", file=out)
+    ASCIIColors.white("    ├─ History Turns: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.history_turns}", file=out)
+    ASCIIColors.white("    ├─ API Key: ", end="", file=out)
+    ASCIIColors.yellow("Set" if args.key else "Not Set", file=out)
+    ASCIIColors.white("    └─ JWT Auth: ", end="", file=out)
+    ASCIIColors.yellow("Enabled" if args.auth_accounts else "Disabled", file=out)
 
     # Directory Configuration
-    ASCIIColors.magenta("\n📂 Directory Configuration:")
-    ASCIIColors.white("    ├─ Working Directory: ", end="")
-    ASCIIColors.yellow(f"{args.working_dir}")
-    ASCIIColors.white("    └─ Input Directory: ", end="")
-    ASCIIColors.yellow(f"{args.input_dir}")
+    ASCIIColors.magenta("\n📂 Directory Configuration:", file=out)
+    ASCIIColors.white("    ├─ Working Directory: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.working_dir}", file=out)
+    ASCIIColors.white("    └─ Input Directory: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.input_dir}", file=out)
 
     # LLM Configuration
-    ASCIIColors.magenta("\n🤖 LLM Configuration:")
-    ASCIIColors.white("    ├─ Binding: ", end="")
-    ASCIIColors.yellow(f"{args.llm_binding}")
-    ASCIIColors.white("    ├─ Host: ", end="")
-    ASCIIColors.yellow(f"{args.llm_binding_host}")
-    ASCIIColors.white("    ├─ Model: ", end="")
-    ASCIIColors.yellow(f"{args.llm_model}")
-    ASCIIColors.white("    ├─ Temperature: ", end="")
-    ASCIIColors.yellow(f"{args.temperature}")
-    ASCIIColors.white("    ├─ Max Async for LLM: ", end="")
-    ASCIIColors.yellow(f"{args.max_async}")
-    ASCIIColors.white("    ├─ Max Tokens: ", end="")
-    ASCIIColors.yellow(f"{args.max_tokens}")
-    ASCIIColors.white("    ├─ Timeout: ", end="")
-    ASCIIColors.yellow(f"{args.timeout if args.timeout else 'None (infinite)'}")
-    ASCIIColors.white("    ├─ LLM Cache Enabled: ", end="")
-    ASCIIColors.yellow(f"{args.enable_llm_cache}")
-    ASCIIColors.white("    └─ LLM Cache for Extraction Enabled: ", end="")
-    ASCIIColors.yellow(f"{args.enable_llm_cache_for_extract}")
+    ASCIIColors.magenta("\n🤖 LLM Configuration:", file=out)
+    ASCIIColors.white("    ├─ Binding: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.llm_binding}", file=out)
+    ASCIIColors.white("    ├─ Host: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.llm_binding_host}", file=out)
+    ASCIIColors.white("    ├─ Model: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.llm_model}", file=out)
+    ASCIIColors.white("    ├─ Temperature: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.temperature}", file=out)
+    ASCIIColors.white("    ├─ Max Async for LLM: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.max_async}", file=out)
+    ASCIIColors.white("    ├─ Max Tokens: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.max_tokens}", file=out)
+    ASCIIColors.white("    ├─ Timeout: ", end="", file=out)
+    ASCIIColors.yellow(
+        f"{args.timeout if args.timeout else 'None (infinite)'}", file=out
+    )
+    ASCIIColors.white("    ├─ LLM Cache Enabled: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.enable_llm_cache}", file=out)
+    ASCIIColors.white("    └─ LLM Cache for Extraction Enabled: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.enable_llm_cache_for_extract}", file=out)
 
     # Embedding Configuration
-    ASCIIColors.magenta("\n📊 Embedding Configuration:")
-    ASCIIColors.white("    ├─ Binding: ", end="")
-    ASCIIColors.yellow(f"{args.embedding_binding}")
-    ASCIIColors.white("    ├─ Host: ", end="")
-    ASCIIColors.yellow(f"{args.embedding_binding_host}")
-    ASCIIColors.white("    ├─ Model: ", end="")
-    ASCIIColors.yellow(f"{args.embedding_model}")
-    ASCIIColors.white("    └─ Dimensions: ", end="")
-    ASCIIColors.yellow(f"{args.embedding_dim}")
+    ASCIIColors.magenta("\n📊 Embedding Configuration:", file=out)
+    ASCIIColors.white("    ├─ Binding: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.embedding_binding}", file=out)
+    ASCIIColors.white("    ├─ Host: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.embedding_binding_host}", file=out)
+    ASCIIColors.white("    ├─ Model: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.embedding_model}", file=out)
+    ASCIIColors.white("    └─ Dimensions: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.embedding_dim}", file=out)
 
     # RAG Configuration
-    ASCIIColors.magenta("\n⚙️ RAG Configuration:")
-    ASCIIColors.white("    ├─ Summary Language: ", end="")
-    ASCIIColors.yellow(f"{args.summary_language}")
-    ASCIIColors.white("    ├─ Max Parallel Insert: ", end="")
-    ASCIIColors.yellow(f"{args.max_parallel_insert}")
-    ASCIIColors.white("    ├─ Max Embed Tokens: ", end="")
-    ASCIIColors.yellow(f"{args.max_embed_tokens}")
-    ASCIIColors.white("    ├─ Chunk Size: ", end="")
-    ASCIIColors.yellow(f"{args.chunk_size}")
-    ASCIIColors.white("    ├─ Chunk Overlap Size: ", end="")
-    ASCIIColors.yellow(f"{args.chunk_overlap_size}")
-    ASCIIColors.white("    ├─ Cosine Threshold: ", end="")
-    ASCIIColors.yellow(f"{args.cosine_threshold}")
-    ASCIIColors.white("    ├─ Top-K: ", end="")
-    ASCIIColors.yellow(f"{args.top_k}")
-    ASCIIColors.white("    ├─ Max Token Summary: ", end="")
+    ASCIIColors.magenta("\n⚙️ RAG Configuration:", file=out)
+    ASCIIColors.white("    ├─ Summary Language: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.summary_language}", file=out)
+    ASCIIColors.white("    ├─ Max Parallel Insert: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.max_parallel_insert}", file=out)
+    ASCIIColors.white("    ├─ Max Embed Tokens: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.max_embed_tokens}", file=out)
+    ASCIIColors.white("    ├─ Chunk Size: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.chunk_size}", file=out)
+    ASCIIColors.white("    ├─ Chunk Overlap Size: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.chunk_overlap_size}", file=out)
+    ASCIIColors.white("    ├─ Cosine Threshold: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.cosine_threshold}", file=out)
+    ASCIIColors.white("    ├─ Top-K: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.top_k}", file=out)
+    ASCIIColors.white("    ├─ Max Token Summary: ", end="", file=out)
     ASCIIColors.yellow(
-        f"{get_env_value('MAX_TOKEN_SUMMARY', DEFAULT_MAX_TOKEN_SUMMARY, int)}"
+        f"{get_env_value('MAX_TOKEN_SUMMARY', DEFAULT_MAX_TOKEN_SUMMARY, int)}",
+        file=out,
     )
-    ASCIIColors.white("    └─ Force LLM Summary on Merge: ", end="")
+    ASCIIColors.white("    └─ Force LLM Summary on Merge: ", end="", file=out)
     ASCIIColors.yellow(
-        f"{get_env_value('FORCE_LLM_SUMMARY_ON_MERGE', DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE, int)}"
+        f"{get_env_value('FORCE_LLM_SUMMARY_ON_MERGE', DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE, int)}",
+        file=out,
     )
 
     # System Configuration
-    ASCIIColors.magenta("\n💾 Storage Configuration:")
-    ASCIIColors.white("    ├─ KV Storage: ", end="")
-    ASCIIColors.yellow(f"{args.kv_storage}")
-    ASCIIColors.white("    ├─ Vector Storage: ", end="")
-    ASCIIColors.yellow(f"{args.vector_storage}")
-    ASCIIColors.white("    ├─ Graph Storage: ", end="")
-    ASCIIColors.yellow(f"{args.graph_storage}")
-    ASCIIColors.white("    └─ Document Status Storage: ", end="")
-    ASCIIColors.yellow(f"{args.doc_status_storage}")
+    ASCIIColors.magenta("\n💾 Storage Configuration:", file=out)
+    ASCIIColors.white("    ├─ KV Storage: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.kv_storage}", file=out)
+    ASCIIColors.white("    ├─ Vector Storage: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.vector_storage}", file=out)
+    ASCIIColors.white("    ├─ Graph Storage: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.graph_storage}", file=out)
+    ASCIIColors.white("    └─ Document Status Storage: ", end="", file=out)
+    ASCIIColors.yellow(f"{args.doc_status_storage}", file=out)
 
     # Server Status
-    ASCIIColors.green("\n✨ Server starting up...\n")
+    ASCIIColors.green("\n✨ Server starting up...\n", file=out)
 
     # Server Access Information
     protocol = "https" if args.ssl else "http"
     if args.host == "0.0.0.0":
-        ASCIIColors.magenta("\n🌐 Server Access Information:")
-        ASCIIColors.white("    ├─ WebUI (local): ", end="")
-        ASCIIColors.yellow(f"{protocol}://localhost:{args.port}")
-        ASCIIColors.white("    ├─ Remote Access: ", end="")
-        ASCIIColors.yellow(f"{protocol}://<your-ip-address>:{args.port}")
-        ASCIIColors.white("    ├─ API Documentation (local): ", end="")
-        ASCIIColors.yellow(f"{protocol}://localhost:{args.port}/docs")
-        ASCIIColors.white("    └─ Alternative Documentation (local): ", end="")
-        ASCIIColors.yellow(f"{protocol}://localhost:{args.port}/redoc")
-
-        ASCIIColors.magenta("\n📝 Note:")
-        ASCIIColors.cyan("""    Since the server is running on 0.0.0.0:
+        ASCIIColors.magenta("\n🌐 Server Access Information:", file=out)
+        ASCIIColors.white("    ├─ WebUI (local): ", end="", file=out)
+        ASCIIColors.yellow(f"{protocol}://localhost:{args.port}", file=out)
+        ASCIIColors.white("    ├─ Remote Access: ", end="", file=out)
+        ASCIIColors.yellow(f"{protocol}://<your-ip-address>:{args.port}", file=out)
+        ASCIIColors.white("    ├─ API Documentation (local): ", end="", file=out)
+        ASCIIColors.yellow(f"{protocol}://localhost:{args.port}/docs", file=out)
+        ASCIIColors.white(
+            "    └─ Alternative Documentation (local): ", end="", file=out
+        )
+        ASCIIColors.yellow(f"{protocol}://localhost:{args.port}/redoc", file=out)
+
+        ASCIIColors.magenta("\n📝 Note:", file=out)
+        ASCIIColors.cyan(
+            """    Since the server is running on 0.0.0.0:
     - Use 'localhost' or '127.0.0.1' for local access
     - Use your machine's IP address for remote access
     - To find your IP address:
       • Windows: Run 'ipconfig' in terminal
       • Linux/Mac: Run 'ifconfig' or 'ip addr' in terminal
-    """)
+    """,
+            file=out,
+        )
     else:
         base_url = f"{protocol}://{args.host}:{args.port}"
-        ASCIIColors.magenta("\n🌐 Server Access Information:")
-        ASCIIColors.white("    ├─ WebUI (local): ", end="")
-        ASCIIColors.yellow(f"{base_url}")
-        ASCIIColors.white("    ├─ API Documentation: ", end="")
-        ASCIIColors.yellow(f"{base_url}/docs")
-        ASCIIColors.white("    └─ Alternative Documentation: ", end="")
-        ASCIIColors.yellow(f"{base_url}/redoc")
+        ASCIIColors.magenta("\n🌐 Server Access Information:", file=out)
+        ASCIIColors.white("    ├─ WebUI (local): ", end="", file=out)
+        ASCIIColors.yellow(f"{base_url}", file=out)
+        ASCIIColors.white("    ├─ API Documentation: ", end="", file=out)
+        ASCIIColors.yellow(f"{base_url}/docs", file=out)
+        ASCIIColors.white("    └─ Alternative Documentation: ", end="", file=out)
+        ASCIIColors.yellow(f"{base_url}/redoc", file=out)
 
     # Security Notice
     if args.key:
-        ASCIIColors.yellow("\n⚠️  Security Notice:")
-        ASCIIColors.white("""    API Key authentication is enabled.
+        ASCIIColors.yellow("\n⚠️  Security Notice:", file=out)
+        ASCIIColors.white(
+            """    API Key authentication is enabled.
     Make sure to include the X-API-Key header in all your requests.
-    """)
+    """,
+            file=out,
+        )
     if args.auth_accounts:
-        ASCIIColors.yellow("\n⚠️  Security Notice:")
-        ASCIIColors.white("""    JWT authentication is enabled.
+        ASCIIColors.yellow("\n⚠️  Security Notice:", file=out)
+        ASCIIColors.white(
+            """    JWT authentication is enabled.
     Make sure to login before making the request, and include the 'Authorization' in the header.
-    """)
+    """,
+            file=out,
+        )
 
     # Ensure splash output flush to system log
+    sys.stdout.write(out.getvalue())
     sys.stdout.flush()
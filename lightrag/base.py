@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import Enum
 import os
-from dotenv import load_dotenv
+from .utils import load_dotenv_once
 from dataclasses import dataclass, field
 from typing import (
     Any,
@@ -18,7 +18,7 @@ from .types import KnowledgeGraph
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+load_dotenv_once()
 
 
 class TextChunkSchema(TypedDict):
@@ -29,12 +29,12 @@ from neo4j import (  # type: ignore
     AsyncManagedTransaction,
 )
 
-from dotenv import load_dotenv
+from ..utils import load_dotenv_once
 
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+load_dotenv_once()
 
 # Get maximum number of graph nodes from environment variable, default is 1000
 MAX_GRAPH_NODES = int(os.getenv("MAX_GRAPH_NODES", 1000))
@@ -21,12 +21,12 @@ from .shared_storage import (
     set_all_update_flags,
 )
 
-from dotenv import load_dotenv
+from lightrag.utils import load_dotenv_once
 
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+load_dotenv_once()
 
 MAX_GRAPH_NODES = int(os.getenv("MAX_GRAPH_NODES", 1000))
 
@@ -72,12 +72,12 @@ from .utils import (
     logger,
 )
 from .types import KnowledgeGraph
-from dotenv import load_dotenv
+from .utils import load_dotenv_once
 
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+load_dotenv_once()
 
 # TODO: TO REMOVE @Yannick
 config = configparser.ConfigParser()
@@ -37,12 +37,12 @@ from lightrag.api import __api_version__
 import numpy as np
 from typing import Any, Union
 
-from dotenv import load_dotenv
+from lightrag.utils import load_dotenv_once
 
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+load_dotenv_once()
 
 
 class InvalidResponseError(Exception):
@@ -51,6 +51,14 @@ class InvalidResponseError(Exception):
     pass
 
 
+class _SharedHttpClientAsyncOpenAI(AsyncOpenAI):
+    """AsyncOpenAI client whose http_client is owned and closed by the caller"""
+
+    async def close(self) -> None:
+        # Keep the shared connection pool open for other clients using it
+        pass
+
+
 def create_openai_async_client(
     api_key: str | None = None,
     base_url: str | None = None,
@@ -63,7 +71,8 @@ def create_openai_async_client(
         base_url: Base URL for the OpenAI API. If None, uses the default OpenAI API URL.
         client_configs: Additional configuration options for the AsyncOpenAI client.
             These will override any default configurations but will be overridden by
-            explicit parameters (api_key, base_url).
+            explicit parameters (api_key, base_url). If an `http_client` is given it
+            is treated as shared, and closing the returned client leaves it open.
 
     Returns:
         An AsyncOpenAI client instance.
@@ -93,6 +102,8 @@ def create_openai_async_client(
             "OPENAI_API_BASE", "https://api.openai.com/v1"
         )
 
+    if merged_configs.get("http_client") is not None:
+        return _SharedHttpClientAsyncOpenAI(**merged_configs)
     return AsyncOpenAI(**merged_configs)
 
 
@@ -59,10 +59,22 @@ def get_env_value(
 if TYPE_CHECKING:
     from lightrag.base import BaseKVStorage
 
+_dotenv_loaded = False
+
+
+def load_dotenv_once():
+    """Load the .env file the first time this is called in the process"""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    load_dotenv(dotenv_path=".env", override=False)
+    _dotenv_loaded = True
+
+
 # use the .env that is inside the current folder
 # allows to use different .env file for each lightrag instance
 # the OS environment variables take precedence over the .env file
-load_dotenv(dotenv_path=".env", override=False)
+load_dotenv_once()
 
 VERBOSE_DEBUG = os.getenv("VERBOSE", "false").lower() == "true"
 
@@ -0,0 +1,5 @@
+import sys
+
+# lightrag.api.config parses the command line when it is imported, keep
+# pytest's own arguments away from its argument parser
+sys.argv = sys.argv[:1]
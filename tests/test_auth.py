@@ -0,0 +1,71 @@
+"""
+Tests for the cached guest token of AuthHandler
+"""
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+import jwt
+import pytest
+
+from lightrag.api import auth
+from lightrag.api.auth import AuthHandler
+
+
+class _FakeDatetime(datetime):
+    """datetime whose utcnow() returns a value set by the test"""
+
+    current = datetime(2025, 1, 1, 12, 0, 0)
+
+    @classmethod
+    def utcnow(cls):
+        return cls.current
+
+
+@pytest.fixture
+def clock():
+    with mock.patch.object(auth, "datetime", _FakeDatetime):
+        yield _FakeDatetime
+
+
+@pytest.fixture
+def handler():
+    handler = AuthHandler()
+    handler.guest_expire_hours = 24
+    return handler
+
+
+def _token_exp(handler, token) -> datetime:
+    payload = jwt.decode(
+        token,
+        handler.secret,
+        algorithms=[handler.algorithm],
+        options={"verify_exp": False},
+    )
+    return datetime.utcfromtimestamp(payload["exp"])
+
+
+def test_guest_token_is_reused_within_half_lifetime(clock, handler):
+    start = clock.current
+    token = handler.get_guest_token()
+
+    clock.current = start + timedelta(hours=11, minutes=59)
+    assert handler.get_guest_token() is token
+
+
+def test_guest_token_is_refreshed_after_half_lifetime(clock, handler):
+    start = clock.current
+    token = handler.get_guest_token()
+
+    clock.current = start + timedelta(hours=12)
+    refreshed = handler.get_guest_token()
+
+    assert refreshed != token
+    assert _token_exp(handler, refreshed) == clock.current + timedelta(hours=24)
+    assert handler.get_guest_token() is refreshed
+
+
+def test_guest_token_expiry_matches_exp_claim(clock, handler):
+    token = handler.get_guest_token()
+
+    assert _token_exp(handler, token) == handler._guest_token_expire
@@ -0,0 +1,55 @@
+"""
+Tests for configure_logging() and reset_logging() of the API server
+"""
+
+import logging
+import logging.config
+
+import pytest
+
+from lightrag.api import lightrag_server
+
+
+@pytest.fixture(autouse=True)
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    lightrag_server.reset_logging()
+    yield tmp_path
+    lightrag_server.reset_logging()
+
+
+def _lightrag_handlers():
+    return list(logging.getLogger("lightrag").handlers)
+
+
+def test_configure_logging_only_runs_once():
+    lightrag_server.configure_logging()
+    handlers = _lightrag_handlers()
+
+    lightrag_server.configure_logging()
+    assert _lightrag_handlers() == handlers
+
+
+def test_reset_logging_allows_reconfiguration(log_dir):
+    lightrag_server.configure_logging()
+    handlers = _lightrag_handlers()
+
+    lightrag_server.reset_logging()
+    lightrag_server.configure_logging()
+
+    assert handlers
+    assert not set(_lightrag_handlers()) & set(handlers)
+    assert lightrag_server._log_file_path.startswith(str(log_dir))
+
+
+def test_failed_configuration_is_retried(monkeypatch):
+    def fail(config):
+        raise ValueError("bad logging config")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(logging.config, "dictConfig", fail)
+        with pytest.raises(ValueError):
+            lightrag_server.configure_logging()
+
+    lightrag_server.configure_logging()
+    assert _lightrag_handlers()
@@ -0,0 +1,51 @@
+"""
+Tests for the installed package lookup in lightrag.api.utils_api
+"""
+
+import sys
+from importlib import metadata
+from unittest import mock
+
+import pytest
+
+from lightrag.api.utils_api import find_missing_packages
+
+
+def _not_found(name):
+    raise metadata.PackageNotFoundError(name)
+
+
+@pytest.fixture
+def site_dir(tmp_path, monkeypatch):
+    """A sys.path made of one directory with the given metadata entries"""
+    for entry in (
+        "Foo_Bar-1.0.dist-info",
+        "zope.interface-5.4.0-py3.10.egg-info",
+        "Simple.egg-info",
+        "not_metadata-1.0.data",
+    ):
+        (tmp_path / entry).mkdir()
+    monkeypatch.setattr(sys, "path", [str(tmp_path)])
+    return tmp_path
+
+
+def test_dist_info_names_are_normalized(site_dir):
+    with mock.patch.object(metadata, "distribution", side_effect=_not_found):
+        assert find_missing_packages(["foo-bar", "FOO.BAR", "foo_bar"]) == []
+
+
+def test_egg_info_names_are_normalized(site_dir):
+    with mock.patch.object(metadata, "distribution", side_effect=_not_found):
+        assert find_missing_packages(["zope-interface", "simple"]) == []
+
+
+def test_missing_packages_keep_their_order(site_dir):
+    with mock.patch.object(metadata, "distribution", side_effect=_not_found):
+        missing = find_missing_packages(["not-metadata", "foo-bar", "other"])
+    assert missing == ["not-metadata", "other"]
+
+
+def test_metadata_lookup_confirms_unscanned_names(site_dir):
+    with mock.patch.object(metadata, "distribution") as distribution:
+        assert find_missing_packages(["elsewhere"]) == []
+    distribution.assert_called_once_with("elsewhere")